@@ -1,11 +1,16 @@
 """MCP Scraper Server - FastMCP server for stealth web scraping."""
 
 import asyncio
+import dataclasses
+import functools
 import json
 import random
 import signal
 import sys
-from datetime import datetime
+from collections import deque
+from datetime import date, datetime
+from math import isinf as _isinf
+from math import isnan as _isnan
 from typing import Any
 
 from fastmcp import FastMCP
@@ -41,7 +46,48 @@ mcp = FastMCP("Scrapling MCP Server")
 _shutdown_event: asyncio.Event | None = None
 
 
+# Accepted-value sets for the validators below, built once at import time so
+# each call is a plain frozenset membership test.
+_STEALTH_LEVELS = frozenset({"minimal", "standard", "maximum"})
+_EXTRACT_MODES = frozenset({"text", "html", "both"})
+
+# Batch size ceiling for scrape_batch URL lists.
+_MAX_URLS = 100
+
+# Validation error messages, precomputed once so validators return shared
+# constants instead of building a new string per rejection.
+_ERRORS = {
+    "url_not_string": "URL must be a string",
+    "url_empty": "URL cannot be empty",
+    "timeout_not_int": "Timeout must be an integer",
+    "timeout_out_of_range": "Timeout must be between 1000 and 300000 milliseconds",
+    "stealth_level_not_string": "Stealth level must be a string",
+    "stealth_level_invalid": "Stealth level must be one of: minimal, standard, maximum",
+    "extract_not_string": "Extract must be a string",
+    "extract_invalid": "Extract must be one of: text, html, both",
+    "delay_not_number": "Delay must be a number",
+    "delay_negative": "Delay must be non-negative",
+    "urls_not_list": "URLs must be a list",
+    "urls_empty": "URLs list cannot be empty",
+    "urls_too_many": "URLs list cannot have more than 100 items",
+    "urls_not_strings": "All URLs must be strings",
+    "selector_not_string": "Selector must be a string",
+}
+
+
 # T030: Input validation functions
+@functools.lru_cache(maxsize=256)
+def _validate_url_param_cached(url: str) -> str | None:
+    """Validate an already-type-checked URL string (memoized).
+
+    Scrape requests often repeat the same URLs (retries, seed lists), so
+    the per-string result is cached in a small bounded LRU.
+    """
+    if not url or not url.strip():
+        return _ERRORS["url_empty"]
+    return None
+
+
 def _validate_url_param(url: Any) -> str | None:
     """Validate URL parameter.
 
@@ -52,10 +98,8 @@ def _validate_url_param(url: Any) -> str | None:
         Error message if invalid, None if valid
     """
     if not isinstance(url, str):
-        return "URL must be a string"
-    if not url or not url.strip():
-        return "URL cannot be empty"
-    return None
+        return _ERRORS["url_not_string"]
+    return _validate_url_param_cached(url)
 
 
 def _validate_timeout(timeout: Any) -> str | None:
@@ -67,10 +111,10 @@ def _validate_timeout(timeout: Any) -> str | None:
     Returns:
         Error message if invalid, None if valid
     """
-    if not isinstance(timeout, int):
-        return "Timeout must be an integer"
+    if type(timeout) is not int and not isinstance(timeout, int):
+        return _ERRORS["timeout_not_int"]
     if timeout < 1000 or timeout > 300000:
-        return "Timeout must be between 1000 and 300000 milliseconds"
+        return _ERRORS["timeout_out_of_range"]
     return None
 
 
@@ -83,12 +127,12 @@ def _validate_stealth_level(level: Any) -> str | None:
     Returns:
         Error message if invalid, None if valid
     """
-    valid_levels = ["minimal", "standard", "maximum"]
     if not isinstance(level, str):
-        return "Stealth level must be a string"
-    if level.lower() not in valid_levels:
-        return f"Stealth level must be one of: {', '.join(valid_levels)}"
-    return None
+        return _ERRORS["stealth_level_not_string"]
+    # Fast path: already-lowercase input needs no new string allocation.
+    if level in _STEALTH_LEVELS or level.casefold() in _STEALTH_LEVELS:
+        return None
+    return _ERRORS["stealth_level_invalid"]
 
 
 def _validate_extract(extract: Any) -> str | None:
@@ -100,12 +144,11 @@ def _validate_extract(extract: Any) -> str | None:
     Returns:
         Error message if invalid, None if valid
     """
-    valid_modes = ["text", "html", "both"]
     if not isinstance(extract, str):
-        return "Extract must be a string"
-    if extract.lower() not in valid_modes:
-        return f"Extract must be one of: {', '.join(valid_modes)}"
-    return None
+        return _ERRORS["extract_not_string"]
+    if extract in _EXTRACT_MODES or extract.casefold() in _EXTRACT_MODES:
+        return None
+    return _ERRORS["extract_invalid"]
 
 
 def _validate_delay(delay: Any) -> str | None:
@@ -117,10 +160,11 @@ def _validate_delay(delay: Any) -> str | None:
     Returns:
         Error message if invalid, None if valid
     """
-    if not isinstance(delay, (int, float)):
-        return "Delay must be a number"
+    t = type(delay)
+    if t is not int and t is not float and not isinstance(delay, (int, float)):
+        return _ERRORS["delay_not_number"]
     if delay < 0:
-        return "Delay must be non-negative"
+        return _ERRORS["delay_negative"]
     return None
 
 
@@ -133,15 +177,18 @@ def _validate_urls_list(urls: Any) -> str | None:
     Returns:
         Error message if invalid, None if valid
     """
-    if not isinstance(urls, list):
-        return "URLs must be a list"
-    if len(urls) == 0:
-        return "URLs list cannot be empty"
-    if len(urls) > 100:
-        return "URLs list cannot have more than 100 items"
-    for url in urls:
-        if not isinstance(url, str):
-            return "All URLs must be strings"
+    if type(urls) is not list and not isinstance(urls, list):
+        return _ERRORS["urls_not_list"]
+    n = len(urls)
+    if n == 0:
+        return _ERRORS["urls_empty"]
+    if n > _MAX_URLS:
+        return _ERRORS["urls_too_many"]
+    # all() with a generator short-circuits in C on the first bad element;
+    # the type() identity check covers the overwhelmingly common exact-str
+    # case without the isinstance call.
+    if not all(type(url) is str or isinstance(url, str) for url in urls):
+        return _ERRORS["urls_not_strings"]
     return None
 
 
@@ -156,11 +203,62 @@ def _validate_selector(selector: Any) -> str | None:
     """
     if selector is None:
         return None
-    if not isinstance(selector, str):
-        return "Selector must be a string"
+    # Exact-type check first: the common str case skips the MRO walk.
+    if type(selector) is str or isinstance(selector, str):
+        return None
+    return _ERRORS["selector_not_string"]
+
+
+def _validate_batch_params(urls: Any, stealth_level: Any, delay: Any) -> tuple[str, str] | None:
+    """Fused validation for the scrape_batch parameters.
+
+    Inlines the urls/stealth-level/delay checks with first-error-wins
+    semantics, so the per-request hot path pays one function frame instead
+    of three. The individual validators remain for single-parameter use.
+
+    Returns:
+        ("urls" | "stealth_level" | "delay", error message) for the first
+        failing parameter, or None if everything validates.
+    """
+    if type(urls) is not list and not isinstance(urls, list):
+        return ("urls", _ERRORS["urls_not_list"])
+    n = len(urls)
+    if n == 0:
+        return ("urls", _ERRORS["urls_empty"])
+    if n > _MAX_URLS:
+        return ("urls", _ERRORS["urls_too_many"])
+    if not all(type(url) is str or isinstance(url, str) for url in urls):
+        return ("urls", _ERRORS["urls_not_strings"])
+
+    if not isinstance(stealth_level, str):
+        return ("stealth_level", _ERRORS["stealth_level_not_string"])
+    if stealth_level not in _STEALTH_LEVELS and stealth_level.casefold() not in _STEALTH_LEVELS:
+        return ("stealth_level", _ERRORS["stealth_level_invalid"])
+
+    t = type(delay)
+    if t is not int and t is not float and not isinstance(delay, (int, float)):
+        return ("delay", _ERRORS["delay_not_number"])
+    if delay < 0:
+        return ("delay", _ERRORS["delay_negative"])
+
     return None
 
 
+# Level -> preset factory mapping, hoisted to module scope so each lookup is
+# a single dict hit instead of building all three configs per call.
+_STEALTH_CONFIG_FACTORIES = {
+    "minimal": get_minimal_stealth,
+    "standard": get_standard_stealth,
+    "maximum": get_maximum_stealth,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _stealth_config_template(key: str) -> StealthConfig:
+    """Build and cache the preset config for a normalized level key."""
+    return _STEALTH_CONFIG_FACTORIES[key]()
+
+
 # T015: Stealth level mapping function
 def _get_stealth_config_by_level(level: str) -> StealthConfig:
     """Map stealth level string to configuration.
@@ -174,18 +272,14 @@ def _get_stealth_config_by_level(level: str) -> StealthConfig:
     Raises:
         ValueError: If invalid stealth level is provided
     """
-    level_map = {
-        "minimal": get_minimal_stealth(),
-        "standard": get_standard_stealth(),
-        "maximum": get_maximum_stealth(),
-    }
-
-    config = level_map.get(level.lower())
-    if config is None:
+    key = level.lower()
+    if key not in _STEALTH_CONFIG_FACTORIES:
         raise ValueError(
             f"Invalid stealth level: '{level}'. Valid options are: minimal, standard, maximum"
         )
-    return config
+    # Copy the cached template: tool handlers mutate the returned config
+    # (timeout, proxy, cloudflare flags), so it must be a fresh instance.
+    return dataclasses.replace(_stealth_config_template(key))
 
 
 @mcp.tool()
@@ -958,35 +1052,16 @@ async def scrape_batch(
         f"scrape_batch called with: urls_count={len(urls)}, stealth_level={stealth_level}, delay={delay}"
     )
 
-    # T030: Input validation
-    if error_msg := _validate_urls_list(urls):
-        logger.warning(f"URLs list validation failed: {error_msg}")
-        return {
-            "total": 0,
-            "successful": 0,
-            "failed": 0,
-            "results": [],
-            "errors": [{"error": error_msg}],
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-        }
-
-    if error_msg := _validate_stealth_level(stealth_level):
-        logger.warning(f"Stealth level validation failed: {error_msg}")
-        return {
-            "total": len(urls),
-            "successful": 0,
-            "failed": len(urls),
-            "results": [],
-            "errors": [{"error": error_msg}],
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-        }
-
-    if error_msg := _validate_delay(delay):
-        logger.warning(f"Delay validation failed: {error_msg}")
+    # T030: Input validation (fused: first error wins)
+    if failed_param := _validate_batch_params(urls, stealth_level, delay):
+        param, error_msg = failed_param
+        logger.warning(f"Batch validation failed ({param}): {error_msg}")
+        # A bad urls parameter means the batch size is unknown.
+        total = 0 if param == "urls" else len(urls)
         return {
-            "total": len(urls),
+            "total": total,
             "successful": 0,
-            "failed": len(urls),
+            "failed": total,
             "results": [],
             "errors": [{"error": error_msg}],
             "timestamp": datetime.utcnow().isoformat() + "Z",
@@ -1131,6 +1206,82 @@ async def scrape_batch(
     return batch_result
 
 
+def _json_passthrough(value: Any) -> Any:
+    return value
+
+
+def _json_float(value: float) -> float | None:
+    if _isnan(value) or _isinf(value):
+        return None
+    return value
+
+
+def _json_str(value: Any) -> str | None:
+    try:
+        return str(value)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _stringify_frozenset(value: frozenset) -> str:
+    return str(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _stringify_set_key(key: frozenset) -> str:
+    # Cached per content (frozenset key) but rendered with set formatting.
+    return str(set(key))
+
+
+def _json_set(value: set) -> str | None:
+    # Repeated identical small sets (config-like payloads) hit the cache;
+    # large or unhashable-member sets stringify directly.
+    if len(value) <= 32:
+        try:
+            return _stringify_set_key(frozenset(value))
+        except TypeError:
+            pass
+    return _json_str(value)
+
+
+# Exact-type dispatch table for leaf values: one hash lookup replaces the
+# isinstance cascade for every node in a nested payload. Containers are
+# handled by the iterative walk in _ensure_json_serializable; subclasses
+# miss the table and fall through to the isinstance path below.
+_JSON_TYPE_HANDLERS: dict[type, Any] = {
+    type(None): lambda value: None,
+    str: _json_passthrough,
+    int: _json_passthrough,
+    bool: _json_passthrough,
+    float: _json_float,
+    # Unbound isoformat: the method fetch is amortized at import, so the
+    # dispatch call is a plain function call with the value as self.
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    set: _json_set,
+    frozenset: _stringify_frozenset,
+    bytes: _json_str,
+    bytearray: _json_str,
+}
+
+
+def _json_leaf(value: Any) -> Any:
+    """Convert a single non-container value to a JSON-serializable one."""
+    handler = _JSON_TYPE_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+
+    # Subclasses of the handled types take the original isinstance path.
+    if isinstance(value, (str, int, float, bool)):
+        if isinstance(value, float) and (_isnan(value) or _isinf(value)):
+            return None
+        return value
+
+    # For any other type, convert to string
+    return _json_str(value)
+
+
 def _ensure_json_serializable(data: Any) -> Any:
     """Ensure all data is JSON-serializable.
 
@@ -1146,29 +1297,50 @@ def _ensure_json_serializable(data: Any) -> Any:
     Returns:
         JSON-serializable version of the data
     """
-    if data is None:
-        return None
-
-    if isinstance(data, (str, int, float, bool)):
-        # Handle special float values
-        if isinstance(data, float):
-            import math
-
-            if math.isnan(data) or math.isinf(data):
-                return None
-        return data
-
-    if isinstance(data, dict):
-        return {k: _ensure_json_serializable(v) for k, v in data.items()}
-
-    if isinstance(data, (list, tuple)):
-        return [_ensure_json_serializable(item) for item in data]
-
-    # For any other type, convert to string
-    try:
-        return str(data)
-    except Exception:
-        return None
+    # Fast path: probe plain dicts/lists with the C encoder. If the whole
+    # subtree already serializes (allow_nan=False rejects NaN/Inf), return
+    # it unchanged instead of walking per node in Python.
+    if type(data) is dict or type(data) is list:
+        try:
+            json.dumps(data, allow_nan=False)
+        except (TypeError, ValueError, RecursionError):
+            pass
+        else:
+            return data
+
+    if not isinstance(data, (dict, list, tuple)):
+        return _json_leaf(data)
+
+    # Containers are rebuilt with an explicit work stack instead of
+    # recursion: no per-frame overhead and no RecursionError on deeply
+    # nested payloads.
+    root: Any = {} if isinstance(data, dict) else []
+    stack: deque[tuple[Any, Any]] = deque([(data, root)])
+    while stack:
+        src, dst = stack.pop()
+        if isinstance(src, dict):
+            for key, value in src.items():
+                if isinstance(value, dict):
+                    child: Any = {}
+                    stack.append((value, child))
+                elif isinstance(value, (list, tuple)):
+                    child = []
+                    stack.append((value, child))
+                else:
+                    child = _json_leaf(value)
+                dst[key] = child
+        else:
+            for value in src:
+                if isinstance(value, dict):
+                    child = {}
+                    stack.append((value, child))
+                elif isinstance(value, (list, tuple)):
+                    child = []
+                    stack.append((value, child))
+                else:
+                    child = _json_leaf(value)
+                dst.append(child)
+    return root
 
 
 def _setup_signal_handlers() -> None:
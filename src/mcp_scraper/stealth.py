@@ -8,22 +8,84 @@ This module provides stealth web scraping capabilities including:
 - Utility functions for scraping and URL validation
 """
 
+from __future__ import annotations
+
 import asyncio
+import importlib
+import ipaddress
+import os
 import random
 import re
-from dataclasses import dataclass
-from datetime import datetime
+import sys
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 from urllib.parse import urlparse
 
 from loguru import logger
 
-# Import scrapling types - use Any for compatibility
-# The scrapling library returns Selector objects with .text, .html, .status, etc.
-# Import core scrapling components
-from scrapling import Selector as Page
-from scrapling.fetchers import AsyncStealthySession
+# Cached UTC tzinfo so response timestamping does not re-resolve the
+# attribute on every call.
+_UTC = timezone.utc
+
+# Interned keys for the dicts built on every scrape (to_scrapling_options and
+# format_response). Interning guarantees downstream lookups take the
+# pointer-equality fast path instead of hash + string compare.
+_K_HEADLESS = sys.intern("headless")
+_K_HUMANIZE = sys.intern("humanize")
+_K_TIMEOUT = sys.intern("timeout")
+_K_STEALTH = sys.intern("stealth")
+_K_PROXY = sys.intern("proxy")
+_K_BLOCK_WEBRTC = sys.intern("block_webrtc")
+_K_WEBGL = sys.intern("webgl")
+_K_BROWSER = sys.intern("browser")
+_K_BLOCK_IMAGES = sys.intern("block_images")
+_K_DISABLE_RESOURCES = sys.intern("disable_resources")
+_K_NETWORK_IDLE = sys.intern("network_idle")
+_K_LOAD_DOM = sys.intern("load_dom")
+_K_WAIT_SELECTOR = sys.intern("wait_selector")
+_K_WAIT_SELECTOR_STATE = sys.intern("wait_selector_state")
+_K_HUMANIZE_DURATION = sys.intern("humanize_duration")
+_K_GEOIP = sys.intern("geoip")
+_K_OS_RANDOMIZE = sys.intern("os_randomize")
+
+_K_URL = sys.intern("url")
+_K_TIMESTAMP = sys.intern("timestamp")
+_K_STATUS = sys.intern("status")
+_K_TITLE = sys.intern("title")
+_K_HTML = sys.intern("html")
+_K_TEXT = sys.intern("text")
+_K_SELECTORS = sys.intern("selectors")
+
+if TYPE_CHECKING:
+    # Scrapling pulls in Playwright-adjacent machinery at import time, which
+    # dominates module import cost (and pytest collection). Import it only for
+    # type checking here; runtime call sites import lazily on first use.
+    from scrapling import Selector as Page
+    from scrapling.fetchers import AsyncStealthySession
+
+
+# Symbols historically re-exported from this module that now load lazily
+# (PEP 562) so importing mcp_scraper.stealth does not import scrapling.
+_LAZY_SCRAPLING_IMPORTS = {
+    "Page": ("scrapling", "Selector"),
+    "AsyncStealthySession": ("scrapling.fetchers", "AsyncStealthySession"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_SCRAPLING_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_path, attr = target
+    value = getattr(importlib.import_module(module_path), attr)
+    globals()[name] = value
+    return value
 
 
 class StealthLevel(Enum):
@@ -39,7 +101,7 @@ class StealthLevel(Enum):
     MAXIMUM = "maximum"
 
 
-@dataclass
+@dataclass(slots=True)
 class StealthConfig:
     """Configuration for stealth web scraping.
 
@@ -83,59 +145,99 @@ class StealthConfig:
     timeout: int = 30
     proxy: str | None = None
 
+    # Internal cache for to_scrapling_options(), keyed on the field values it
+    # was built from so mutation (e.g. timeout/proxy overrides) invalidates it.
+    # The payload is stored behind a read-only proxy so nothing can mutate the
+    # cached dict in place; callers always receive a fresh copy.
+    _options_cache: tuple[tuple[Any, ...], MappingProxyType[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _options_key(self) -> tuple[Any, ...]:
+        """Build a tuple of the field values that feed to_scrapling_options()."""
+        return (
+            self.headless,
+            self.solve_cloudflare,
+            self.humanize,
+            self.humanize_duration,
+            self.geoip,
+            self.os_randomize,
+            self.block_webrtc,
+            self.allow_webgl,
+            self.google_search,
+            self.block_images,
+            self.disable_resources,
+            self.network_idle,
+            self.load_dom,
+            self.wait_selector,
+            self.wait_selector_state,
+            self.timeout,
+            self.proxy,
+        )
+
     def to_scrapling_options(self) -> dict[str, Any]:
-        """Convert config to scrapling options format."""
+        """Convert config to scrapling options format.
+
+        The result is built once per unique field state and cached on the
+        instance; repeated calls return a cheap copy of the cached dict.
+        """
+        key = self._options_key()
+        cached = self._options_cache
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
+
         options: dict[str, Any] = {
-            "headless": self.headless,
-            "humanize": self.humanize,
+            _K_HEADLESS: self.headless,
+            _K_HUMANIZE: self.humanize,
             # Convert seconds to milliseconds for scrapling
-            "timeout": self.timeout * 1000,
+            _K_TIMEOUT: self.timeout * 1000,
         }
 
         if self.solve_cloudflare:
-            options["stealth"] = True
+            options[_K_STEALTH] = True
 
         if self.proxy:
-            options["proxy"] = self.proxy
+            options[_K_PROXY] = self.proxy
 
         if self.block_webrtc:
-            options["block_webrtc"] = True
+            options[_K_BLOCK_WEBRTC] = True
 
         if not self.allow_webgl:
-            options["webgl"] = False
+            options[_K_WEBGL] = False
 
         if self.google_search:
-            options["browser"] = "chrome"
+            options[_K_BROWSER] = "chrome"
 
         if self.block_images:
-            options["block_images"] = True
+            options[_K_BLOCK_IMAGES] = True
 
         if self.disable_resources:
-            options["disable_resources"] = True
+            options[_K_DISABLE_RESOURCES] = True
 
         # Additional stealth options
         if self.network_idle:
-            options["network_idle"] = True
+            options[_K_NETWORK_IDLE] = True
 
         if self.load_dom:
-            options["load_dom"] = True
+            options[_K_LOAD_DOM] = True
 
         if self.wait_selector:
-            options["wait_selector"] = self.wait_selector
+            options[_K_WAIT_SELECTOR] = self.wait_selector
 
         if self.wait_selector_state:
-            options["wait_selector_state"] = self.wait_selector_state
+            options[_K_WAIT_SELECTOR_STATE] = self.wait_selector_state
 
         if self.humanize_duration:
-            options["humanize_duration"] = self.humanize_duration
+            options[_K_HUMANIZE_DURATION] = self.humanize_duration
 
         if self.geoip:
-            options["geoip"] = True
+            options[_K_GEOIP] = True
 
         if self.os_randomize:
-            options["os_randomize"] = True
+            options[_K_OS_RANDOMIZE] = True
 
-        return options
+        self._options_cache = (key, MappingProxyType(options))
+        return dict(options)
 
 
 # Global session storage
@@ -143,6 +245,72 @@ _session: AsyncStealthySession | None = None
 _config_cache: StealthConfig | None = None
 
 
+# Preset keyword tables: a shared base plus per-profile overrides, merged once
+# at import time so each factory is a single ** unpack instead of re-evaluating
+# ~15 keyword arguments per call.
+_BASE_PRESET_KWARGS: Final[dict[str, Any]] = {
+    "headless": True,
+    "solve_cloudflare": False,
+    "allow_webgl": False,
+    "proxy": None,
+}
+
+_MINIMAL_PRESET_KWARGS: Final[dict[str, Any]] = {
+    **_BASE_PRESET_KWARGS,
+    "humanize": False,
+    "geoip": False,
+    "os_randomize": False,
+    "block_webrtc": False,
+    "google_search": False,
+    "block_images": True,
+    "disable_resources": True,
+    "timeout": 15,
+}
+
+_STANDARD_PRESET_KWARGS: Final[dict[str, Any]] = {
+    **_BASE_PRESET_KWARGS,
+    "humanize": True,
+    "geoip": False,
+    "os_randomize": True,
+    "block_webrtc": True,
+    "google_search": True,
+    "block_images": False,
+    "disable_resources": False,
+    "timeout": 30,
+}
+
+_MAXIMUM_PRESET_KWARGS: Final[dict[str, Any]] = {
+    **_BASE_PRESET_KWARGS,
+    "solve_cloudflare": True,
+    "humanize": True,
+    "geoip": True,
+    "os_randomize": True,
+    "block_webrtc": True,
+    "google_search": True,
+    "block_images": False,
+    "disable_resources": False,
+    "timeout": 60,
+}
+
+
+# Cached preset template builders: each template is constructed once on
+# first use (not at import), and the factories below hand out replace()
+# copies so callers can keep mutating their config freely.
+@cache
+def _minimal_template() -> StealthConfig:
+    return StealthConfig(**_MINIMAL_PRESET_KWARGS)
+
+
+@cache
+def _standard_template() -> StealthConfig:
+    return StealthConfig(**_STANDARD_PRESET_KWARGS)
+
+
+@cache
+def _maximum_template() -> StealthConfig:
+    return StealthConfig(**_MAXIMUM_PRESET_KWARGS)
+
+
 def get_minimal_stealth() -> StealthConfig:
     """Get minimal stealth configuration for fast, basic anti-detection.
 
@@ -154,20 +322,7 @@ def get_minimal_stealth() -> StealthConfig:
     Returns:
         StealthConfig with minimal protection settings
     """
-    return StealthConfig(
-        headless=True,
-        solve_cloudflare=False,
-        humanize=False,
-        geoip=False,
-        os_randomize=False,
-        block_webrtc=False,
-        allow_webgl=False,
-        google_search=False,
-        block_images=True,
-        disable_resources=True,
-        timeout=15,
-        proxy=None,
-    )
+    return replace(_minimal_template())
 
 
 def get_standard_stealth() -> StealthConfig:
@@ -181,20 +336,7 @@ def get_standard_stealth() -> StealthConfig:
     Returns:
         StealthConfig with balanced settings
     """
-    return StealthConfig(
-        headless=True,
-        solve_cloudflare=False,
-        humanize=True,
-        geoip=False,
-        os_randomize=True,
-        block_webrtc=True,
-        allow_webgl=False,
-        google_search=True,
-        block_images=False,
-        disable_resources=False,
-        timeout=30,
-        proxy=None,
-    )
+    return replace(_standard_template())
 
 
 def get_maximum_stealth() -> StealthConfig:
@@ -209,20 +351,7 @@ def get_maximum_stealth() -> StealthConfig:
     Returns:
         StealthConfig with maximum protection settings
     """
-    return StealthConfig(
-        headless=True,
-        solve_cloudflare=True,
-        humanize=True,
-        geoip=True,
-        os_randomize=True,
-        block_webrtc=True,
-        allow_webgl=False,
-        google_search=True,
-        block_images=False,
-        disable_resources=False,
-        timeout=60,
-        proxy=None,
-    )
+    return replace(_maximum_template())
 
 
 def get_stealth_config(level: StealthLevel) -> StealthConfig:
@@ -264,6 +393,8 @@ async def get_session(config: StealthConfig | None = None) -> AsyncStealthySessi
     """
     global _session, _config_cache
 
+    from scrapling.fetchers import AsyncStealthySession
+
     if config is None:
         config = get_standard_stealth()
 
@@ -376,6 +507,8 @@ async def scrape_with_retry(
         ScrapeError: For other scraping errors
         ValueError: If URL validation fails
     """
+    from scrapling.fetchers import AsyncStealthySession
+
     # Validate URL first
     if not validate_url(url):
         raise ValueError(f"Invalid or disallowed URL: {url}")
@@ -447,9 +580,52 @@ async def scrape_with_retry(
     raise last_error or ScrapeError("Max retries exceeded")
 
 
+# Challenge/block marker keywords, folded into one precompiled alternation
+# per detector so each page body is scanned once in C instead of once per
+# keyword. A dedicated multi-pattern dependency (e.g. pyahocorasick) is not
+# warranted for keyword sets this small.
+_CLOUDFLARE_INDICATORS = (
+    "cloudflare",
+    "checking your browser",
+    "just a moment",
+    "enable cookies",
+    "ray id",
+)
+_BLOCK_INDICATORS = (
+    "access denied",
+    "forbidden",
+    "rate limit",
+    "blocked",
+    "captcha",
+    "please wait",
+    "too many requests",
+)
+# IGNORECASE lets the engine case-fold while scanning, so detectors never
+# materialize a lowercased copy of the whole page body.
+_CLOUDFLARE_RE = re.compile("|".join(map(re.escape, _CLOUDFLARE_INDICATORS)), re.IGNORECASE)
+_BLOCK_RE = re.compile("|".join(map(re.escape, _BLOCK_INDICATORS)), re.IGNORECASE)
+
+
+def _status_is_clean(page: Page) -> bool:
+    """True when the HTTP status alone rules out a challenge or block page.
+
+    Cloudflare challenges and block pages ship with 4xx/5xx statuses, so a
+    definite 2xx/3xx means the body scan can be skipped entirely. Pages
+    without a usable status fall through to the scan.
+    """
+    try:
+        status = getattr(page, "status", None)
+    except Exception:
+        return False
+    return isinstance(status, int) and 200 <= status < 400
+
+
 def _detect_cloudflare(page: Page) -> bool:
     """Detect if page contains Cloudflare challenge.
 
+    A clean 2xx/3xx status short-circuits before the body scan; challenge
+    pages always arrive with 403/503/429.
+
     Args:
         page: Scraped page object
 
@@ -457,17 +633,12 @@ def _detect_cloudflare(page: Page) -> bool:
         True if Cloudflare challenge detected
     """
     try:
+        if _status_is_clean(page):
+            return False
         # Check for Cloudflare-specific elements
         if hasattr(page, "html"):
-            html = str(getattr(page, "html", "")).lower()
-            cloudflare_indicators = [
-                "cloudflare",
-                "checking your browser",
-                "just a moment",
-                "enable cookies",
-                "ray id",
-            ]
-            return any(indicator in html for indicator in cloudflare_indicators)
+            html = str(getattr(page, "html", ""))
+            return _CLOUDFLARE_RE.search(html) is not None
         return False
     except Exception:
         return False
@@ -476,6 +647,9 @@ def _detect_cloudflare(page: Page) -> bool:
 def _detect_block(page: Page) -> bool:
     """Detect if request was blocked.
 
+    A clean 2xx/3xx status short-circuits before the body scan, mirroring
+    _detect_cloudflare.
+
     Args:
         page: Scraped page object
 
@@ -483,23 +657,107 @@ def _detect_block(page: Page) -> bool:
         True if blocked detected
     """
     try:
+        if _status_is_clean(page):
+            return False
         if hasattr(page, "html"):
-            html = str(getattr(page, "html", "")).lower()
-            block_indicators = [
-                "access denied",
-                "forbidden",
-                "rate limit",
-                "blocked",
-                "captcha",
-                "please wait",
-                "too many requests",
-            ]
-            return any(indicator in html for indicator in block_indicators)
+            html = str(getattr(page, "html", ""))
+            return _BLOCK_RE.search(html) is not None
         return False
     except Exception:
         return False
 
 
+def _page_body_for_scan(page: Page) -> str:
+    """Read a page's HTML for detector scanning, tolerating odd page objects.
+
+    Pages whose status already rules out a challenge contribute an empty
+    body so the batched scan skips them, matching the scalar detectors.
+    """
+    try:
+        if _status_is_clean(page):
+            return ""
+        if hasattr(page, "html"):
+            return str(getattr(page, "html", ""))
+    except Exception:
+        pass
+    return ""
+
+
+def _detect_batch(pages: list[Page], pattern: re.Pattern[str]) -> list[bool]:
+    """Scan many page bodies with a single combined regex pass.
+
+    Bodies are joined with a NUL separator (which cannot occur inside the
+    indicator strings), so the regex engine is entered once for the whole
+    batch instead of once per page. Matches are mapped back to their page
+    by bisecting over the cumulative body offsets.
+    """
+    if not pages:
+        return []
+
+    bodies = [_page_body_for_scan(page) for page in pages]
+    combined = "\x00".join(bodies)
+
+    # Start offset of each body inside the combined buffer.
+    starts: list[int] = []
+    offset = 0
+    for body in bodies:
+        starts.append(offset)
+        offset += len(body) + 1
+
+    hits = [False] * len(bodies)
+    remaining = len(bodies)
+    for match in pattern.finditer(combined):
+        index = bisect_right(starts, match.start()) - 1
+        if not hits[index]:
+            hits[index] = True
+            remaining -= 1
+            if remaining == 0:
+                break
+    return hits
+
+
+def _detect_cloudflare_batch(pages: list[Page]) -> list[bool]:
+    """Batched _detect_cloudflare: one regex pass over all page bodies."""
+    return _detect_batch(pages, _CLOUDFLARE_RE)
+
+
+def _detect_block_batch(pages: list[Page]) -> list[bool]:
+    """Batched _detect_block: one regex pass over all page bodies."""
+    return _detect_batch(pages, _BLOCK_RE)
+
+
+class _LazyResponse(dict):
+    """format_response mapping that defers text extraction to first access.
+
+    Behaves like the plain dict format_response used to return, except the
+    "text" value is pulled from the page only when actually read: error and
+    html-only paths skip the full-page text conversion entirely. Note that
+    iterating keys before "text" has been touched will not include it.
+    """
+
+    __slots__ = ("_page",)
+
+    def __init__(self, data: dict[str, Any], page: Page):
+        super().__init__(data)
+        self._page = page
+
+    def __missing__(self, key: str) -> Any:
+        if key == _K_TEXT:
+            value = _page_text(self._page)
+            self[_K_TEXT] = value
+            return value
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key == _K_TEXT or dict.__contains__(self, key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 def format_response(
     page: Page,
     url: str,
@@ -522,18 +780,35 @@ def format_response(
             - selectors: Dict of extracted selector values
             - timestamp: ISO format timestamp
     """
-    response: dict[str, Any] = {
-        "url": url,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-    }
+    # "text" is intentionally absent: _LazyResponse extracts it on first read.
+    response: dict[str, Any] = _LazyResponse(
+        {
+            _K_URL: url,
+            _K_TIMESTAMP: datetime.now(_UTC).isoformat(timespec="seconds"),
+            _K_STATUS: _page_status(page),
+            _K_TITLE: _page_title(page),
+            _K_HTML: _page_html(page),
+        },
+        page,
+    )
+
+    # Extract specific selectors if provided
+    if selectors:
+        response[_K_SELECTORS] = extract_selectors(page, selectors)
+
+    return response
+
 
-    # Get status code - scrapling Response has .status attribute
+def _page_status(page: Page) -> int | None:
+    """Read the HTTP status code - scrapling Response has .status attribute."""
     try:
-        response["status"] = getattr(page, "status", None)
+        return getattr(page, "status", None)
     except Exception:
-        pass
+        return None
 
-    # Get page title - use CSS selector since Selector doesn't have .title property
+
+def _page_title(page: Page) -> str | None:
+    """Read the page title via CSS since Selector doesn't have .title property."""
     try:
         if hasattr(page, "css"):
             # Use scrapling's css() method to get title element
@@ -542,45 +817,39 @@ def format_response(
                 # Get first title element
                 first_title = title_element[0]
                 if hasattr(first_title, "get_all_text"):
-                    response["title"] = first_title.get_all_text(strip=True)
-                elif hasattr(first_title, "text"):
-                    response["title"] = first_title.text
-                else:
-                    response["title"] = str(first_title) if first_title else None
-            else:
-                response["title"] = None
-        else:
-            response["title"] = getattr(page, "title", None)
+                    return first_title.get_all_text(strip=True)
+                if hasattr(first_title, "text"):
+                    return first_title.text
+                return str(first_title) if first_title else None
+            return None
+        return getattr(page, "title", None)
     except Exception as e:
         logger.debug(f"Error extracting title: {e}")
-        response["title"] = None
+        return None
+
 
-    # Get HTML content - scrapling Response uses .body for raw HTML
+def _page_html(page: Page) -> Any:
+    """Read raw HTML - scrapling Response uses .body, html_content as fallback."""
     try:
-        response["html"] = getattr(page, "body", None)
-        # Fallback to html_content if body is not available
-        if response["html"] is None:
-            response["html"] = getattr(page, "html_content", None)
+        html = getattr(page, "body", None)
+        if html is None:
+            html = getattr(page, "html_content", None)
+        return html
     except Exception:
-        pass
+        return None
 
-    # Get text content - use get_all_text() method for full page text
+
+def _page_text(page: Page) -> str:
+    """Read full page text via get_all_text() with a .text fallback."""
     try:
         if hasattr(page, "get_all_text"):
-            response["text"] = page.get_all_text(strip=True)
-        elif hasattr(page, "text"):
-            response["text"] = page.text
-        else:
-            response["text"] = ""
+            return page.get_all_text(strip=True)
+        if hasattr(page, "text"):
+            return page.text
+        return ""
     except Exception as e:
         logger.debug(f"Error extracting text: {e}")
-        response["text"] = ""
-
-    # Extract specific selectors if provided
-    if selectors:
-        response["selectors"] = extract_selectors(page, selectors)
-
-    return response
+        return ""
 
 
 def extract_selectors(page: Page, selectors: dict[str, str]) -> dict[str, Any]:
@@ -592,6 +861,12 @@ def extract_selectors(page: Page, selectors: dict[str, str]) -> dict[str, Any]:
     - Attribute extraction: "selector@attrname" - extracts attribute value
     - Multiple elements: "selector" - returns list of values
 
+    Selector names that share the same underlying CSS query (after the
+    ::html/::attr()/@attr suffixes are stripped) reuse a single page.css()
+    call, so the DOM is walked once per unique query rather than once per
+    name. Maps of 8+ selectors additionally fan the queries out to a
+    shared thread pool (see _extract_selectors_threaded).
+
     Args:
         page: Scraped page object
         selectors: Dict of {name: css_selector}
@@ -599,42 +874,115 @@ def extract_selectors(page: Page, selectors: dict[str, str]) -> dict[str, Any]:
     Returns:
         Dict with extracted values for each selector name
     """
+    if len(selectors) >= _SELECTOR_POOL_THRESHOLD:
+        return _extract_selectors_threaded(page, selectors)
+
     extracted: dict[str, Any] = {}
 
     try:
+        query_results: dict[str, Any] = {}
         for name, selector in selectors.items():
-            result = _extract_single_selector(page, selector)
-            extracted[name] = result
+            query, text_extraction, html_extraction, attr_extraction = _parse_selector_spec(
+                selector
+            )
+            if query is None:
+                logger.warning(f"Empty selector after parsing: {selector}")
+                extracted[name] = None
+                continue
+
+            if query in query_results:
+                elements = query_results[query]
+            else:
+                elements = _query_selector(page, query, selector)
+                query_results[query] = elements
+
+            if elements is None:
+                extracted[name] = None
+                continue
+
+            extracted[name] = _postprocess_elements(
+                elements, text_extraction, html_extraction, attr_extraction
+            )
     except Exception as e:
         logger.warning(f"Error extracting selectors: {e}")
 
     return extracted
 
 
-def _extract_single_selector(page: Page, selector: str) -> Any:
-    """Extract data from a single CSS selector.
+# Large selector maps fan their CSS queries out to a shared thread pool:
+# the lxml matching underneath page.css() runs in C and releases the GIL,
+# so independent queries against the same (read-only) tree scale with cores.
+# Small maps stay on the synchronous loop to avoid thread-dispatch overhead.
+_SELECTOR_POOL_THRESHOLD = 8
+_selector_pool: ThreadPoolExecutor | None = None
 
-    Supports:
-    - "selector" - extract text content (first match or all matches)
-    - "selector::html" - extract HTML content
-    - "selector::text" - extract text using scrapling's ::text pseudo-element
-    - "selector@attr" - extract attribute value (DEPRECATED: use selector::attr(attr) instead)
-    - "selector::attr(attr)" - extract attribute using scrapling's ::attr() pseudo-element
-    - "selector@attr1@attr2" - extract multiple attributes as dict
 
-    Args:
-        page: Scraped page object (scrapling Selector)
-        selector: CSS selector with optional ::html, ::text, ::attr(), or @attr suffix
+def _get_selector_pool() -> ThreadPoolExecutor:
+    """Return the shared selector-extraction pool, creating it lazily."""
+    global _selector_pool
+    if _selector_pool is None:
+        _selector_pool = ThreadPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, 8),
+            thread_name_prefix="selector-extract",
+        )
+    return _selector_pool
 
-    Returns:
-        Extracted value (str, list, or dict)
+
+def _extract_selectors_threaded(page: Page, selectors: dict[str, str]) -> dict[str, Any]:
+    """extract_selectors fast path for large selector maps.
+
+    Submits one page.css() per unique query to the shared pool, then runs
+    the (cheap, Python-level) postprocessing synchronously. Matches the
+    synchronous loop's semantics, including per-name None for empty or
+    failed queries.
     """
-    # Check if page has css method (required for scrapling)
-    if not hasattr(page, "css"):
-        logger.warning(f"Page object missing 'css' method - cannot extract: {selector}")
-        return None
+    extracted: dict[str, Any] = {}
+
+    try:
+        pool = _get_selector_pool()
+        specs: dict[str, tuple[str, tuple[str | None, bool, bool, str | None]]] = {}
+        query_futures: dict[str, Any] = {}
+        for name, selector in selectors.items():
+            spec = _parse_selector_spec(selector)
+            specs[name] = (selector, spec)
+            query = spec[0]
+            if query is not None and query not in query_futures:
+                query_futures[query] = pool.submit(_query_selector, page, query, selector)
+
+        for name, (selector, spec) in specs.items():
+            query, text_extraction, html_extraction, attr_extraction = spec
+            if query is None:
+                logger.warning(f"Empty selector after parsing: {selector}")
+                extracted[name] = None
+                continue
+
+            elements = query_futures[query].result()
+            if elements is None:
+                extracted[name] = None
+                continue
+
+            extracted[name] = _postprocess_elements(
+                elements, text_extraction, html_extraction, attr_extraction
+            )
+    except Exception as e:
+        logger.warning(f"Error extracting selectors: {e}")
+
+    return extracted
+
 
-    # Parse selector for special syntax
+@lru_cache(maxsize=512)
+def _parse_selector_spec(selector: str) -> tuple[str | None, bool, bool, str | None]:
+    """Parse a selector string into its CSS query and extraction flags.
+
+    The parse is pure, so results are memoized per selector string: long
+    scraping runs re-use the same selector specs across pages without
+    re-running the suffix regexes.
+
+    Returns:
+        Tuple of (css query or None if empty, text extraction flag,
+        html extraction flag, attribute spec or None). The query keeps
+        scrapling-native pseudo-elements like ::text intact.
+    """
     html_extraction = "::html" in selector
     text_extraction = "::text" in selector
     attr_extraction = None
@@ -662,28 +1010,132 @@ def _extract_single_selector(page: Page, selector: str) -> Any:
     clean_selector = selector.replace("::html", "").strip()
 
     if not clean_selector:
-        logger.warning(f"Empty selector after parsing: {selector}")
-        return None
+        return None, text_extraction, html_extraction, attr_extraction
 
-    logger.debug(
-        f"Extracting with selector: '{clean_selector}', html={html_extraction}, text={text_extraction}, attr={attr_extraction}"
-    )
+    return clean_selector, text_extraction, html_extraction, attr_extraction
+
+
+# Simple selector shapes ("#id", ".cls", "tag") that can bypass the CSS
+# engine when the page object exposes native id/class/tag lookups.
+_ID_RE = re.compile(r"[A-Za-z][\w-]*\Z")
+_CLS_RE = re.compile(r"[A-Za-z][\w-]*\Z")
+_TAG_RE = re.compile(r"[A-Za-z][A-Za-z0-9]*\Z")
+
+# Sentinel distinguishing "no native fast path applied" from a real result.
+_NO_NATIVE = object()
+
+
+def _query_native(page: Page, query: str) -> Any:
+    """Resolve simple id/class/tag selectors via the page's native lookups.
+
+    Skips the CSS parse + full tree walk for the common "#id", ".cls" and
+    bare-tag shapes when the page object provides the corresponding
+    accessor. Returns _NO_NATIVE when the shape or accessor is unavailable
+    so the caller falls back to page.css().
+    """
+    if query.startswith("#") and _ID_RE.fullmatch(query, 1):
+        finder = getattr(page, "get_element_by_id", None)
+        if finder is not None:
+            # lxml raises KeyError without a default; pass None explicitly.
+            element = finder(query[1:], None)
+            # A single element can be falsy (childless lxml nodes), so test
+            # against None and wrap the hit in a list to match css() shape.
+            return None if element is None else [element]
+    elif query.startswith(".") and _CLS_RE.fullmatch(query, 1):
+        finder = getattr(page, "get_elements_by_class_name", None)
+        if finder is not None:
+            return finder(query[1:])
+    elif _TAG_RE.fullmatch(query):
+        finder = getattr(page, "get_elements_by_tag_name", None)
+        if finder is not None:
+            return finder(query)
+    return _NO_NATIVE
+
+
+def _query_selector(page: Page, query: str, original: str) -> Any:
+    """Run page.css(query), returning None when unavailable or empty.
+
+    Simple id/class/tag selectors try the page's native lookups first and
+    only fall back to the CSS engine when those are missing or fail.
+    """
+    try:
+        elements = _query_native(page, query)
+        if elements is not _NO_NATIVE:
+            if not elements or (hasattr(elements, "__len__") and len(elements) == 0):
+                return None
+            return elements
+    except Exception as e:
+        logger.debug(f"Native lookup failed for '{query}', falling back to css(): {e}")
+
+    if not hasattr(page, "css"):
+        logger.warning(f"Page object missing 'css' method - cannot extract: {original}")
+        return None
 
-    # Get elements matching selector using scrapling's css() method
     try:
-        elements = page.css(clean_selector)
+        elements = page.css(query)
         logger.debug(
             f"css() returned: type={type(elements)}, len={len(elements) if hasattr(elements, '__len__') else 'N/A'}"
         )
     except Exception as e:
-        logger.warning(f"Error executing css('{clean_selector}'): {e}")
+        logger.warning(f"Error executing css('{query}'): {e}")
         return None
 
-    # Check if we got any elements
     if not elements or (hasattr(elements, "__len__") and len(elements) == 0):
-        logger.debug(f"No elements found for selector: {clean_selector}")
+        logger.debug(f"No elements found for selector: {query}")
         return None
 
+    return elements
+
+
+@lru_cache(maxsize=512)
+def _element_accessor(
+    text_extraction: bool,
+    html_extraction: bool,
+    attr_extraction: str | None,
+) -> Any:
+    """Build a per-element extraction callable for a parsed selector spec.
+
+    The extraction mode is fixed per selector, so the text/html/attr dispatch
+    is resolved here once (and memoized alongside the parsed spec) instead of
+    being re-branched for every matched element.
+    """
+    # ::text pseudo-element already extracted text; just stringify
+    if text_extraction:
+        return str
+
+    if html_extraction:
+        return _get_element_html
+
+    if attr_extraction:
+        if "@" in attr_extraction:
+            # Multiple attributes: "selector@attr1@attr2"
+            attrs = tuple(attr_extraction.split("@"))
+
+            def _multi_attr(element: Any) -> dict[str, str | None]:
+                return _get_element_attrs(element, attrs)
+
+            return _multi_attr
+
+        attr = attr_extraction
+
+        def _single_attr(element: Any) -> str | None:
+            return _get_element_attribute(element, attr)
+
+        return _single_attr
+
+    # Default: text content
+    return _get_element_text
+
+
+def _postprocess_elements(
+    elements: Any,
+    text_extraction: bool,
+    html_extraction: bool,
+    attr_extraction: str | None,
+) -> Any:
+    """Convert matched elements into the requested extraction output."""
+    accessor = _element_accessor(text_extraction, html_extraction, attr_extraction)
+
     # Handle single element vs multiple elements
     # Check if it's a Selectors collection (list-like) vs single Selector
     is_collection = (
@@ -700,70 +1152,74 @@ def _extract_single_selector(page: Page, selector: str) -> Any:
         if len(element_list) == 0:
             return None
 
-        # Handle text extraction using ::text pseudo-element
-        if text_extraction:
-            # The ::text pseudo-element already extracted text, just return as list
-            return [str(el) for el in element_list]
-
-        if html_extraction:
-            return [_get_element_html(el) for el in element_list]
-
-        if attr_extraction:
-            if "@" in attr_extraction:
-                # Multiple attributes: "selector@attr1@attr2"
-                attrs = attr_extraction.split("@")
-                result = []
-                for el in element_list:
-                    attr_dict = {}
-                    for attr in attrs:
-                        attr_dict[attr] = _get_element_attribute(el, attr)
-                    result.append(attr_dict)
-                return result
-            else:
-                return [_get_element_attribute(el, attr_extraction) for el in element_list]
-
-        # Default: return text content for each element
-        return [_get_element_text(el) for el in element_list]
+        return [accessor(el) for el in element_list]
     else:
         # Single element (first one extracted via extract_first() or similar)
         element = elements
         logger.debug(f"Processing single element: {type(element)}")
 
-        # Handle text extraction using ::text pseudo-element
-        if text_extraction:
-            return str(element) if element is not None else None
+        if element is None:
+            return None
 
-        if html_extraction:
-            return _get_element_html(element)
+        return accessor(element)
 
-        if attr_extraction:
-            if "@" in attr_extraction:
-                # Multiple attributes
-                attrs = attr_extraction.split("@")
-                return {attr: _get_element_attribute(element, attr) for attr in attrs}
-            else:
-                return _get_element_attribute(element, attr_extraction)
 
-        # Default: return text content
-        return _get_element_text(element)
+def _extract_single_selector(page: Page, selector: str) -> Any:
+    """Extract data from a single CSS selector.
+
+    Supports:
+    - "selector" - extract text content (first match or all matches)
+    - "selector::html" - extract HTML content
+    - "selector::text" - extract text using scrapling's ::text pseudo-element
+    - "selector@attr" - extract attribute value (DEPRECATED: use selector::attr(attr) instead)
+    - "selector::attr(attr)" - extract attribute using scrapling's ::attr() pseudo-element
+    - "selector@attr1@attr2" - extract multiple attributes as dict
+
+    Args:
+        page: Scraped page object (scrapling Selector)
+        selector: CSS selector with optional ::html, ::text, ::attr(), or @attr suffix
+
+    Returns:
+        Extracted value (str, list, or dict)
+    """
+    query, text_extraction, html_extraction, attr_extraction = _parse_selector_spec(selector)
+    if query is None:
+        logger.warning(f"Empty selector after parsing: {selector}")
+        return None
+
+    logger.debug(
+        f"Extracting with selector: '{query}', html={html_extraction}, text={text_extraction}, attr={attr_extraction}"
+    )
+
+    elements = _query_selector(page, query, selector)
+    if elements is None:
+        return None
+
+    return _postprocess_elements(elements, text_extraction, html_extraction, attr_extraction)
+
+
+# Sentinel + fallback-order tables for the element readers below. A single
+# getattr with the sentinel default replaces each hasattr/access pair, so
+# every probed name costs one attribute lookup instead of two.
+_MISSING = object()
+_TEXT_FALLBACK_ATTRS = ("inner_text", "text_content", "textContent", "innerHTML")
+_HTML_ATTRS = ("html_content", "html", "innerHTML", "outerHTML")
 
 
 def _get_element_text(element: Any) -> str | None:
     """Extract text content from an element."""
     try:
-        if hasattr(element, "text"):
+        value: Any = getattr(element, "text", _MISSING)
+        if value is not _MISSING:
             # Try get_all_text first for recursive text extraction
-            if hasattr(element, "get_all_text"):
-                return element.get_all_text(strip=True)
-            return element.text  # type: ignore[no-any-return]
-        elif hasattr(element, "inner_text"):
-            return element.inner_text  # type: ignore[no-any-return]
-        elif hasattr(element, "text_content"):
-            return element.text_content  # type: ignore[no-any-return]
-        elif hasattr(element, "textContent"):
-            return element.textContent  # type: ignore[no-any-return]
-        elif hasattr(element, "innerHTML"):
-            return element.innerHTML  # type: ignore[no-any-return]
+            get_all_text = getattr(element, "get_all_text", None)
+            if get_all_text is not None:
+                return get_all_text(strip=True)  # type: ignore[no-any-return]
+            return value  # type: ignore[no-any-return]
+        for name in _TEXT_FALLBACK_ATTRS:
+            value = getattr(element, name, _MISSING)
+            if value is not _MISSING:
+                return value  # type: ignore[no-any-return]
         return str(element) if element else None
     except Exception:
         return None
@@ -772,19 +1228,41 @@ def _get_element_text(element: Any) -> str | None:
 def _get_element_html(element: Any) -> str | None:
     """Extract HTML content from an element."""
     try:
-        if hasattr(element, "html_content"):
-            return element.html_content  # type: ignore[no-any-return]
-        elif hasattr(element, "html"):
-            return element.html  # type: ignore[no-any-return]
-        elif hasattr(element, "innerHTML"):
-            return element.innerHTML  # type: ignore[no-any-return]
-        elif hasattr(element, "outerHTML"):
-            return element.outerHTML  # type: ignore[no-any-return]
+        value: Any
+        for name in _HTML_ATTRS:
+            value = getattr(element, name, _MISSING)
+            if value is not _MISSING:
+                return value  # type: ignore[no-any-return]
         return str(element) if element else None
     except Exception:
         return None
 
 
+def _get_element_attrs(element: Any, names: tuple[str, ...]) -> dict[str, str | None]:
+    """Extract several attribute values with one attribute-mapping read.
+
+    lxml-backed elements expose all attributes as a single dict-like
+    mapping; reading it once and probing per name is cheaper than running
+    the full per-attribute fallback chain K times. The mapping is
+    duck-typed on a callable .get because lxml's _Attrib and scrapling's
+    AttributesHandler are dict-like without subclassing dict. Elements
+    without such a mapping fall back to _get_element_attribute per name.
+    """
+    try:
+        attrs = getattr(element, "attrib", None)
+        if attrs is None:
+            attrs = getattr(element, "attributes", None)
+        getter = getattr(attrs, "get", None)
+        if callable(getter):
+            return {
+                name: (str(value) if (value := getter(name)) is not None else None)
+                for name in names
+            }
+    except Exception:
+        pass
+    return {name: _get_element_attribute(element, name) for name in names}
+
+
 def _get_element_attribute(element: Any, attr: str) -> str | None:
     """Extract attribute value from an element."""
     try:
@@ -814,23 +1292,29 @@ def _get_element_attribute(element: Any, attr: str) -> str | None:
         return None
 
 
-def validate_url(url: str) -> bool:
-    """Validate URL to prevent SSRF attacks.
-
-    This function checks for:
-    - Valid URL format
-    - Allowed protocols (http, https)
-    - No private/internal IP addresses
-    - No localhost variants
-    - No file:// or other dangerous schemes
+# Host-classification tables for validate_url, built once at import time.
+# The private-IP alternation folds the per-range patterns into a single
+# compiled regex; the suffix tuple feeds str.endswith directly.
+_BLOCKED_HOSTS = frozenset(
+    {"localhost", "127.0.0.1", "::1", "0.0.0.0", "::", "localhost.localdomain"}
+)
+_PRIVATE_IP_RE = re.compile(
+    r"^(?:10\.|172\.(?:1[6-9]|2[0-9]|3[0-1])\.|192\.168\.|169\.254\.|127\.)"
+)
+_INTERNAL_SUFFIXES = (".local", ".internal", ".corp", ".lan")
+_DANGEROUS_SCHEME_PREFIXES = ("file:", "ftp:", "ssh:", "javascript:", "telnet:", "gopher:")
 
-    Args:
-        url: URL to validate
 
-    Returns:
-        True if URL is safe to scrape
-    """
+@lru_cache(maxsize=4096)
+def _classify_url(url: str) -> bool:
+    """Classify a URL for validate_url (memoized per URL string)."""
     try:
+        # Known-dangerous schemes reject before paying for urlparse;
+        # str.startswith walks the prefix tuple in C.
+        if url.startswith(_DANGEROUS_SCHEME_PREFIXES):
+            logger.warning(f"Disallowed URL scheme: {url.split(':', 1)[0]}")
+            return False
+
         parsed = urlparse(url)
 
         # Check protocol
@@ -843,46 +1327,36 @@ def validate_url(url: str) -> bool:
             logger.warning("URL has no host")
             return False
 
-        # Get hostname (without port)
-        hostname = parsed.netloc.split(":")[0].lower()
+        # Get hostname (without port). urlparse.hostname is None for bare
+        # IPv6 netlocs like "::1", so fall back to the raw netloc there.
+        hostname = parsed.hostname or parsed.netloc.lower()
+
+        # Literal IP addresses: one stdlib classification covers loopback,
+        # RFC1918/ULA private, link-local, and unspecified for v4 and v6.
+        try:
+            ip = ipaddress.ip_address(hostname)
+        except ValueError:
+            pass
+        else:
+            if ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_unspecified:
+                logger.warning(f"Blocked private IP: {hostname}")
+                return False
+            return True
 
         # Block localhost variants
-        localhost_patterns = [
-            "localhost",
-            "127.0.0.1",
-            "::1",
-            "0.0.0.0",
-            "::",
-            "localhost.localdomain",
-        ]
-        if hostname in localhost_patterns:
+        if hostname in _BLOCKED_HOSTS:
             logger.warning(f"Blocked localhost URL: {hostname}")
             return False
 
-        # Block private IP ranges (basic check)
-        private_patterns = [
-            "^10\\.",
-            "^172\\.(1[6-9]|2[0-9]|3[0-1])\\.",
-            "^192\\.168\\.",
-            "^169\\.254\\.",  # Link-local
-            "^127\\.",  # Loopback
-        ]
-        for pattern in private_patterns:
-            if re.match(pattern, hostname):
-                logger.warning(f"Blocked private IP: {hostname}")
-                return False
+        # Block hostnames that merely start like a private IP (conservative)
+        if _PRIVATE_IP_RE.match(hostname):
+            logger.warning(f"Blocked private IP: {hostname}")
+            return False
 
         # Block internal hostnames
-        internal_patterns = [
-            "^.*\\.local$",
-            "^.*\\.internal$",
-            "^.*\\.corp$",
-            "^.*\\.lan$",
-        ]
-        for pattern in internal_patterns:
-            if re.match(pattern, hostname):
-                logger.warning(f"Blocked internal hostname: {hostname}")
-                return False
+        if hostname.endswith(_INTERNAL_SUFFIXES):
+            logger.warning(f"Blocked internal hostname: {hostname}")
+            return False
 
         return True
 
@@ -891,6 +1365,37 @@ def validate_url(url: str) -> bool:
         return False
 
 
+def validate_url(url: str) -> bool:
+    """Validate URL to prevent SSRF attacks.
+
+    This function checks for:
+    - Valid URL format
+    - Allowed protocols (http, https)
+    - No private/internal IP addresses
+    - No localhost variants
+    - No file:// or other dangerous schemes
+
+    Results are cached per URL string in a bounded LRU, so retries and
+    duplicate batch entries skip the parse/classification work.
+
+    Args:
+        url: URL to validate
+
+    Returns:
+        True if URL is safe to scrape
+    """
+    try:
+        return _classify_url(url)
+    except TypeError:
+        # Unhashable inputs cannot reach the cache; they are never valid URLs.
+        return False
+
+
+# Dedicated RNG for proxy rotation: avoids contending on the module-global
+# random instance when multiple scrapes rotate concurrently.
+_PROXY_RNG = random.Random()
+
+
 def rotate_proxy(proxy_list: list[str]) -> str | None:
     """Simple proxy rotation function.
 
@@ -905,7 +1410,7 @@ def rotate_proxy(proxy_list: list[str]) -> str | None:
     if not proxy_list:
         return None
 
-    return random.choice(proxy_list)
+    return _PROXY_RNG.choice(proxy_list)
 
 
 def get_element_text(element: Any) -> str:
@@ -947,13 +1452,19 @@ def get_element_text(element: Any) -> str:
         scrapling's css() method, which may return elements with different
         text properties depending on the library version.
     """
-    # Try .text property first (most common in scrapling)
-    if hasattr(element, "text"):
+    # Try .text property first (most common in scrapling). EAFP: hasattr is
+    # getattr-plus-except under the hood, so the try avoids probing the
+    # attribute machinery twice on the happy path.
+    try:
         return element.text
+    except AttributeError:
+        pass
 
     # Fall back to .inner_text
-    if hasattr(element, "inner_text"):
+    try:
         return element.inner_text
+    except AttributeError:
+        pass
 
     # Last resort: convert to string
     return str(element)
@@ -1006,12 +1517,16 @@ def get_element_html(element: Any) -> str:
         inner HTML content.
     """
     # Try .html property first
-    if hasattr(element, "html"):
+    try:
         return element.html
+    except AttributeError:
+        pass
 
     # Fall back to .innerHTML
-    if hasattr(element, "innerHTML"):
+    try:
         return element.innerHTML
+    except AttributeError:
+        pass
 
     return ""
 
@@ -1076,15 +1591,14 @@ def get_element_attribute(element: Any, attribute: str) -> str | None:
         - "name" - Form field name
         - "value" - Form field value
     """
-    # Try .get_attribute() method first (standard in browser automation)
-    if hasattr(element, "get_attribute"):
-        return element.get_attribute(attribute)
+    # Try .get_attribute() method first (standard in browser automation);
+    # bind it once instead of hasattr followed by a second lookup.
+    getter = getattr(element, "get_attribute", None)
+    if getter is not None:
+        return getter(attribute)
 
     # Fall back to direct property access
-    if hasattr(element, attribute):
-        return getattr(element, attribute)
-
-    return None
+    return getattr(element, attribute, None)
 
 
 async def cleanup_stealth() -> None:
@@ -437,7 +437,7 @@ def mock_page_404():
 @pytest.fixture
 def mock_page_cloudflare(cloudflare_challenge_html):
     """Create a mock page with Cloudflare challenge."""
-    return MockPage(body=cloudflare_challenge_html, status=200, url="https://protected-site.com")
+    return MockPage(body=cloudflare_challenge_html, status=503, url="https://protected-site.com")
 
 
 @pytest.fixture
@@ -0,0 +1,54 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from mcp_scraper.stealth import (
+    get_maximum_stealth,
+    get_minimal_stealth,
+    get_standard_stealth,
+)
+
+# ============================================================================
+# Stealth Profile Fixtures
+# ============================================================================
+#
+# The session-scoped fixtures below construct each preset once for the whole
+# test run. They must only be used by read-only tests: a test that mutates a
+# config must use a function-scoped fixture (e.g. fresh_minimal) so the
+# mutation cannot leak into sibling tests. Keeping mutation out of the shared
+# fixtures also keeps the suite safe under pytest-xdist (pytest -n auto).
+
+
+@pytest.fixture(scope="session")
+def minimal_config():
+    """Session-scoped minimal stealth profile for read-only tests."""
+    return get_minimal_stealth()
+
+
+@pytest.fixture(scope="session")
+def standard_config():
+    """Session-scoped standard stealth profile for read-only tests."""
+    return get_standard_stealth()
+
+
+@pytest.fixture(scope="session")
+def maximum_config():
+    """Session-scoped maximum stealth profile for read-only tests."""
+    return get_maximum_stealth()
+
+
+@pytest.fixture
+def fresh_minimal():
+    """Function-scoped minimal profile for tests that mutate the config."""
+    return get_minimal_stealth()
+
+
+# ============================================================================
+# Validation Input Fixtures
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def over_limit_urls():
+    """A 101-entry URL list (one past the batch limit), built once."""
+    return [f"https://example.com/{i}" for i in range(101)]
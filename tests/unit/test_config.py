@@ -8,6 +8,9 @@ Tests cover:
 - Preset functions: get_minimal_stealth, get_standard_stealth, get_maximum_stealth
 """
 
+import dataclasses
+from types import MappingProxyType
+
 import pytest
 
 from mcp_scraper.stealth import (
@@ -18,6 +21,55 @@ from mcp_scraper.stealth import (
 )
 
 
+def _config_dict(config: StealthConfig) -> dict:
+    """Public field values of a StealthConfig as a plain dict."""
+    return {
+        f.name: getattr(config, f.name)
+        for f in dataclasses.fields(config)
+        if not f.name.startswith("_")
+    }
+
+
+# Expected default field values (from stealth.py AGENTS.md spec). Comparing
+# against this table in one assert replaces a per-field assert chain while
+# pytest's dict diff still pinpoints any mismatched field.
+EXPECTED_DEFAULTS = {
+    "headless": True,
+    "solve_cloudflare": False,
+    "humanize": True,
+    "humanize_duration": 1.5,
+    "geoip": False,
+    "os_randomize": True,
+    "block_webrtc": True,
+    "allow_webgl": False,  # stealth.py uses False, not True
+    "google_search": True,
+    "block_images": False,
+    "block_ads": True,
+    "disable_resources": False,
+    "network_idle": False,
+    "load_dom": False,
+    "wait_selector": None,
+    "wait_selector_state": None,
+    "timeout": 30,  # stealth.py uses seconds, not milliseconds
+    "proxy": None,
+}
+
+
+# ============================================================================
+# Shared Fixtures
+# ============================================================================
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Shared default StealthConfig for read-only tests.
+
+    Module-scoped so the dataclass is constructed once instead of per test.
+    Tests that mutate a config must construct their own instance.
+    """
+    return StealthConfig()
+
+
 # ============================================================================
 # StealthConfig Tests
 # ============================================================================
@@ -26,33 +78,13 @@ from mcp_scraper.stealth import (
 class TestStealthConfigDefaults:
     """Tests for StealthConfig default values."""
 
-    def test_default_values_all_fields(self):
+    def test_default_values_all_fields(self, default_config):
         """Test that StealthConfig has correct default values for all fields."""
-        config = StealthConfig()
-
-        # Core stealth settings (from stealth.py AGENTS.md spec)
-        assert config.headless is True
-        assert config.solve_cloudflare is False
-        assert config.humanize is True
-        assert config.humanize_duration == 1.5
-        assert config.geoip is False
-        assert config.os_randomize is True
-        assert config.block_webrtc is True
-        assert config.allow_webgl is False  # stealth.py uses False, not True
-        assert config.google_search is True
-        assert config.block_images is False
-        assert config.block_ads is True
-        assert config.disable_resources is False
-        assert config.network_idle is False
-        assert config.load_dom is False
-        assert config.wait_selector is None
-        assert config.wait_selector_state is None
-        assert config.timeout == 30  # stealth.py uses seconds, not milliseconds
-        assert config.proxy is None
+        assert _config_dict(default_config) == EXPECTED_DEFAULTS
 
-    def test_default_optional_fields(self):
+    def test_default_optional_fields(self, default_config):
         """Test default values for optional fields."""
-        config = StealthConfig()
+        config = default_config
 
         assert config.wait_selector is None
         assert config.wait_selector_state is None
@@ -64,35 +96,26 @@ class TestStealthConfigCustomValues:
 
     def test_custom_boolean_values(self):
         """Test assigning custom boolean values to StealthConfig."""
-        config = StealthConfig(
-            headless=False,
-            solve_cloudflare=True,
-            humanize=False,
-            geoip=True,
-            os_randomize=False,
-            block_webrtc=False,
-            allow_webgl=True,
-            google_search=False,
-            block_images=True,
-            block_ads=False,
-            disable_resources=True,
-            network_idle=True,
-            load_dom=True,
-        )
-
-        assert config.headless is False
-        assert config.solve_cloudflare is True
-        assert config.humanize is False
-        assert config.geoip is True
-        assert config.os_randomize is False
-        assert config.block_webrtc is False
-        assert config.allow_webgl is True
-        assert config.google_search is False
-        assert config.block_images is True
-        assert config.block_ads is False
-        assert config.disable_resources is True
-        assert config.network_idle is True
-        assert config.load_dom is True
+        expected = {
+            "headless": False,
+            "solve_cloudflare": True,
+            "humanize": False,
+            "geoip": True,
+            "os_randomize": False,
+            "block_webrtc": False,
+            "allow_webgl": True,
+            "google_search": False,
+            "block_images": True,
+            "block_ads": False,
+            "disable_resources": True,
+            "network_idle": True,
+            "load_dom": True,
+        }
+        config = StealthConfig(**expected)
+
+        # One dict comparison instead of a per-field assert chain; pytest's
+        # dict diff still pinpoints any mismatched field.
+        assert {name: getattr(config, name) for name in expected} == expected
 
     def test_custom_numeric_values(self):
         """Test assigning custom numeric values to StealthConfig."""
@@ -120,10 +143,9 @@ class TestStealthConfigCustomValues:
 class TestStealthConfigToScraplingOptions:
     """Tests for StealthConfig.to_scrapling_options() method."""
 
-    def test_to_scrapling_options_default_config(self):
+    def test_to_scrapling_options_default_config(self, default_config):
         """Test to_scrapling_options() returns correct dictionary for default config."""
-        config = StealthConfig()
-        result = config.to_scrapling_options()
+        result = default_config.to_scrapling_options()
 
         assert isinstance(result, dict)
         assert result["headless"] is True
@@ -256,23 +278,27 @@ class TestStealthConfigToScraplingOptions:
         )
         result = config.to_scrapling_options()
 
-        # Core fields that should be present (set to non-default values)
-        assert "headless" in result
-        assert "humanize" in result
-        assert "timeout" in result
-        assert "stealth" in result  # solve_cloudflare=True
-        assert "proxy" in result
-        assert "block_webrtc" in result
-        assert "webgl" in result  # allow_webfl=False
-        assert "block_images" in result
-        assert "disable_resources" in result
-        assert "network_idle" in result
-        assert "load_dom" in result
-        assert "wait_selector" in result
-        assert "wait_selector_state" in result
-        assert "humanize_duration" in result
-        assert "geoip" in result
-        assert "os_randomize" in result
+        # Core fields that should be present (set to non-default values);
+        # a single set comparison replaces the per-key assert chain.
+        expected_keys = {
+            "headless",
+            "humanize",
+            "timeout",
+            "stealth",  # solve_cloudflare=True
+            "proxy",
+            "block_webrtc",
+            "webgl",  # allow_webgl=False
+            "block_images",
+            "disable_resources",
+            "network_idle",
+            "load_dom",
+            "wait_selector",
+            "wait_selector_state",
+            "humanize_duration",
+            "geoip",
+            "os_randomize",
+        }
+        assert expected_keys <= result.keys()
         # google_search=False means browser=chrome won't be added
         assert "browser" not in result
 
@@ -320,306 +346,243 @@ class TestStealthConfigEdgeCases:
 # ============================================================================
 
 
+# Expected per-profile attribute values, hoisted into read-only tables so the
+# attribute tests below are generated from data instead of repeating literals.
+EXPECTED_MINIMAL = MappingProxyType(
+    {
+        "headless": True,
+        "solve_cloudflare": False,
+        "humanize": False,
+        "geoip": False,
+        "os_randomize": False,
+        "block_webrtc": False,
+        "allow_webgl": False,
+        "google_search": False,
+        "block_images": True,
+        "disable_resources": True,
+        "timeout": 15,
+        "proxy": None,
+    }
+)
+
+EXPECTED_STANDARD = MappingProxyType(
+    {
+        "headless": True,
+        "solve_cloudflare": False,
+        "humanize": True,
+        "humanize_duration": 1.5,
+        "geoip": False,
+        "os_randomize": True,
+        "block_webrtc": True,
+        "allow_webgl": False,
+        "google_search": True,
+        "block_images": False,
+        "block_ads": True,
+        "disable_resources": False,
+        "timeout": 30,
+        "proxy": None,
+    }
+)
+
+EXPECTED_MAXIMUM = MappingProxyType(
+    {
+        "headless": True,
+        "solve_cloudflare": True,
+        "humanize": True,
+        "humanize_duration": 1.5,
+        "geoip": True,
+        "os_randomize": True,
+        "block_webrtc": True,
+        "allow_webgl": False,
+        "google_search": True,
+        "block_images": False,
+        "block_ads": True,
+        "disable_resources": False,
+        "timeout": 60,
+        "proxy": None,
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "getter",
+    [get_minimal_stealth, get_standard_stealth, get_maximum_stealth],
+    ids=["minimal", "standard", "maximum"],
+)
+def test_preset_returns_stealth_config(getter):
+    """Test that each preset factory returns a StealthConfig instance."""
+    assert isinstance(getter(), StealthConfig)
+
+
 class TestGetMinimalStealth:
     """Tests for get_minimal_stealth() function."""
 
-    def test_minimal_returns_stealth_config(self):
-        """Test that get_minimal_stealth() returns a StealthConfig instance."""
-        config = get_minimal_stealth()
-        assert isinstance(config, StealthConfig)
-
-    def test_minimal_headless(self):
-        """Test minimal profile headless setting."""
-        config = get_minimal_stealth()
-        assert config.headless is True
-
-    def test_minimal_solve_cloudflare(self):
-        """Test minimal profile solve_cloudflare setting."""
-        config = get_minimal_stealth()
-        assert config.solve_cloudflare is False
-
-    def test_minimal_humanize(self):
-        """Test minimal profile humanize setting."""
-        config = get_minimal_stealth()
-        assert config.humanize is False
-
-    def test_minimal_geoip(self):
-        """Test minimal profile geoip setting."""
-        config = get_minimal_stealth()
-        assert config.geoip is False
-
-    def test_minimal_os_randomize(self):
-        """Test minimal profile os_randomize setting."""
-        config = get_minimal_stealth()
-        assert config.os_randomize is False
-
-    def test_minimal_block_webrtc(self):
-        """Test minimal profile block_webrtc setting."""
-        config = get_minimal_stealth()
-        assert config.block_webrtc is False
-
-    def test_minimal_allow_webgl(self):
-        """Test minimal profile allow_webgl setting."""
-        config = get_minimal_stealth()
-        assert config.allow_webgl is False
-
-    def test_minimal_google_search(self):
-        """Test minimal profile google_search setting."""
-        config = get_minimal_stealth()
-        assert config.google_search is False
-
-    def test_minimal_block_images(self):
-        """Test minimal profile block_images setting."""
-        config = get_minimal_stealth()
-        assert config.block_images is True
-
-    def test_minimal_disable_resources(self):
-        """Test minimal profile disable_resources setting."""
-        config = get_minimal_stealth()
-        assert config.disable_resources is True
-
-    def test_minimal_timeout(self):
-        """Test minimal profile timeout setting (in seconds)."""
-        config = get_minimal_stealth()
-        assert config.timeout == 15
-
-    def test_minimal_proxy(self):
-        """Test minimal profile proxy setting."""
-        config = get_minimal_stealth()
-        assert config.proxy is None
+    @pytest.mark.parametrize("attr,expected", EXPECTED_MINIMAL.items())
+    def test_minimal_attr(self, minimal_config, attr, expected):
+        """Test minimal profile attribute values."""
+        assert getattr(minimal_config, attr) == expected
 
 
 class TestGetStandardStealth:
     """Tests for get_standard_stealth() function."""
 
-    def test_standard_returns_stealth_config(self):
-        """Test that get_standard_stealth() returns a StealthConfig instance."""
-        config = get_standard_stealth()
-        assert isinstance(config, StealthConfig)
-
-    def test_standard_headless(self):
-        """Test standard profile headless setting."""
-        config = get_standard_stealth()
-        assert config.headless is True
-
-    def test_standard_solve_cloudflare(self):
-        """Test standard profile solve_cloudflare setting."""
-        config = get_standard_stealth()
-        assert config.solve_cloudflare is False
-
-    def test_standard_humanize(self):
-        """Test standard profile humanize setting."""
-        config = get_standard_stealth()
-        assert config.humanize is True
-
-    def test_standard_humanize_duration(self):
-        """Test standard profile humanize_duration setting."""
-        config = get_standard_stealth()
-        assert config.humanize_duration == 1.5
-
-    def test_standard_geoip(self):
-        """Test standard profile geoip setting."""
-        config = get_standard_stealth()
-        assert config.geoip is False
-
-    def test_standard_os_randomize(self):
-        """Test standard profile os_randomize setting."""
-        config = get_standard_stealth()
-        assert config.os_randomize is True
-
-    def test_standard_block_webrtc(self):
-        """Test standard profile block_webrtc setting."""
-        config = get_standard_stealth()
-        assert config.block_webrtc is True
-
-    def test_standard_allow_webgl(self):
-        """Test standard profile allow_webgl setting."""
-        config = get_standard_stealth()
-        assert config.allow_webgl is False
-
-    def test_standard_google_search(self):
-        """Test standard profile google_search setting."""
-        config = get_standard_stealth()
-        assert config.google_search is True
-
-    def test_standard_block_images(self):
-        """Test standard profile block_images setting."""
-        config = get_standard_stealth()
-        assert config.block_images is False
-
-    def test_standard_block_ads(self):
-        """Test standard profile block_ads setting."""
-        config = get_standard_stealth()
-        assert config.block_ads is True
-
-    def test_standard_disable_resources(self):
-        """Test standard profile disable_resources setting."""
-        config = get_standard_stealth()
-        assert config.disable_resources is False
-
-    def test_standard_timeout(self):
-        """Test standard profile timeout setting (in seconds)."""
-        config = get_standard_stealth()
-        assert config.timeout == 30
-
-    def test_standard_proxy(self):
-        """Test standard profile proxy setting."""
-        config = get_standard_stealth()
-        assert config.proxy is None
+    @pytest.mark.parametrize("attr,expected", EXPECTED_STANDARD.items())
+    def test_standard_attr(self, standard_config, attr, expected):
+        """Test standard profile attribute values."""
+        assert getattr(standard_config, attr) == expected
 
 
 class TestGetMaximumStealth:
     """Tests for get_maximum_stealth() function."""
 
-    def test_maximum_returns_stealth_config(self):
-        """Test that get_maximum_stealth() returns a StealthConfig instance."""
-        config = get_maximum_stealth()
-        assert isinstance(config, StealthConfig)
-
-    def test_maximum_headless(self):
-        """Test maximum profile headless setting."""
-        config = get_maximum_stealth()
-        assert config.headless is True
-
-    def test_maximum_solve_cloudflare(self):
-        """Test maximum profile solve_cloudflare setting."""
-        config = get_maximum_stealth()
-        assert config.solve_cloudflare is True
-
-    def test_maximum_humanize(self):
-        """Test maximum profile humanize setting."""
-        config = get_maximum_stealth()
-        assert config.humanize is True
-
-    def test_maximum_humanize_duration(self):
-        """Test maximum profile humanize_duration setting."""
-        config = get_maximum_stealth()
-        assert config.humanize_duration == 1.5
-
-    def test_maximum_geoip(self):
-        """Test maximum profile geoip setting."""
-        config = get_maximum_stealth()
-        assert config.geoip is True
-
-    def test_maximum_os_randomize(self):
-        """Test maximum profile os_randomize setting."""
-        config = get_maximum_stealth()
-        assert config.os_randomize is True
-
-    def test_maximum_block_webrtc(self):
-        """Test maximum profile block_webrtc setting."""
-        config = get_maximum_stealth()
-        assert config.block_webrtc is True
-
-    def test_maximum_allow_webgl(self):
-        """Test maximum profile allow_webgl setting."""
-        config = get_maximum_stealth()
-        assert config.allow_webgl is False
-
-    def test_maximum_google_search(self):
-        """Test maximum profile google_search setting."""
-        config = get_maximum_stealth()
-        assert config.google_search is True
-
-    def test_maximum_block_images(self):
-        """Test maximum profile block_images setting."""
-        config = get_maximum_stealth()
-        assert config.block_images is False
-
-    def test_maximum_block_ads(self):
-        """Test maximum profile block_ads setting."""
-        config = get_maximum_stealth()
-        assert config.block_ads is True
-
-    def test_maximum_disable_resources(self):
-        """Test maximum profile disable_resources setting."""
-        config = get_maximum_stealth()
-        assert config.disable_resources is False
-
-    def test_maximum_timeout(self):
-        """Test maximum profile timeout setting (in seconds)."""
-        config = get_maximum_stealth()
-        assert config.timeout == 60
-
-    def test_maximum_proxy(self):
-        """Test maximum profile proxy setting."""
-        config = get_maximum_stealth()
-        assert config.proxy is None
-
-
-class TestStealthProfilesComparison:
-    """Tests comparing different stealth profiles."""
+    @pytest.mark.parametrize("attr,expected", EXPECTED_MAXIMUM.items())
+    def test_maximum_attr(self, maximum_config, attr, expected):
+        """Test maximum profile attribute values."""
+        assert getattr(maximum_config, attr) == expected
+
+
+# Full-field snapshots of each preset, sorted by field name. A snapshot test
+# compares all public fields in one tuple equality, so any preset regression
+# surfaces in a single diff. Built via dataclasses.fields (not vars()) so the
+# helper keeps working if StealthConfig ever grows __slots__.
+_MINIMAL_SNAPSHOT = (
+    ("allow_webgl", False),
+    ("block_ads", True),
+    ("block_images", True),
+    ("block_webrtc", False),
+    ("disable_resources", True),
+    ("geoip", False),
+    ("google_search", False),
+    ("headless", True),
+    ("humanize", False),
+    ("humanize_duration", 1.5),
+    ("load_dom", False),
+    ("network_idle", False),
+    ("os_randomize", False),
+    ("proxy", None),
+    ("solve_cloudflare", False),
+    ("timeout", 15),
+    ("wait_selector", None),
+    ("wait_selector_state", None),
+)
 
-    def test_minimal_vs_standard_timeout_difference(self):
-        """Test that minimal has shorter timeout than standard."""
-        minimal = get_minimal_stealth()
-        standard = get_standard_stealth()
-        assert minimal.timeout < standard.timeout
+_STANDARD_SNAPSHOT = (
+    ("allow_webgl", False),
+    ("block_ads", True),
+    ("block_images", False),
+    ("block_webrtc", True),
+    ("disable_resources", False),
+    ("geoip", False),
+    ("google_search", True),
+    ("headless", True),
+    ("humanize", True),
+    ("humanize_duration", 1.5),
+    ("load_dom", False),
+    ("network_idle", False),
+    ("os_randomize", True),
+    ("proxy", None),
+    ("solve_cloudflare", False),
+    ("timeout", 30),
+    ("wait_selector", None),
+    ("wait_selector_state", None),
+)
 
-    def test_standard_vs_maximum_timeout_difference(self):
-        """Test that standard has shorter timeout than maximum."""
-        standard = get_standard_stealth()
-        maximum = get_maximum_stealth()
-        assert standard.timeout < maximum.timeout
+_MAXIMUM_SNAPSHOT = (
+    ("allow_webgl", False),
+    ("block_ads", True),
+    ("block_images", False),
+    ("block_webrtc", True),
+    ("disable_resources", False),
+    ("geoip", True),
+    ("google_search", True),
+    ("headless", True),
+    ("humanize", True),
+    ("humanize_duration", 1.5),
+    ("load_dom", False),
+    ("network_idle", False),
+    ("os_randomize", True),
+    ("proxy", None),
+    ("solve_cloudflare", True),
+    ("timeout", 60),
+    ("wait_selector", None),
+    ("wait_selector_state", None),
+)
 
-    def test_minimal_no_humanize(self):
-        """Test that minimal profile disables humanization."""
-        minimal = get_minimal_stealth()
-        assert minimal.humanize is False
 
-    def test_standard_has_humanize(self):
-        """Test that standard profile enables humanization."""
-        standard = get_standard_stealth()
-        assert standard.humanize is True
+class TestStealthProfileSnapshots:
+    """Whole-profile snapshot tests catching any preset field regression."""
+
+    @pytest.mark.parametrize(
+        "profile_name,snapshot",
+        [
+            ("minimal", _MINIMAL_SNAPSHOT),
+            ("standard", _STANDARD_SNAPSHOT),
+            ("maximum", _MAXIMUM_SNAPSHOT),
+        ],
+    )
+    def test_profile_snapshot(
+        self, profile_name, snapshot, minimal_config, standard_config, maximum_config
+    ):
+        """Test every public field of a preset against its frozen snapshot."""
+        profiles = {
+            "minimal": minimal_config,
+            "standard": standard_config,
+            "maximum": maximum_config,
+        }
+        config = profiles[profile_name]
+        assert tuple(sorted(_config_dict(config).items())) == snapshot
+
+
+# Cross-profile expectations driving the comparison suite below. Each row is
+# (profile, attr, expected); timeout rows double as the ordering check
+# (minimal < standard < maximum) via test_profile_timeouts_increase.
+PROFILE_EXPECTATIONS = [
+    ("minimal", "timeout", 15),
+    ("standard", "timeout", 30),
+    ("maximum", "timeout", 60),
+    ("minimal", "humanize", False),
+    ("standard", "humanize", True),
+    ("maximum", "humanize", True),
+    ("minimal", "solve_cloudflare", False),
+    ("standard", "solve_cloudflare", False),
+    ("maximum", "solve_cloudflare", True),
+    ("minimal", "geoip", False),
+    ("standard", "geoip", False),
+    ("maximum", "geoip", True),
+    ("minimal", "block_images", True),
+    ("standard", "block_images", False),
+    ("minimal", "disable_resources", True),
+    ("standard", "disable_resources", False),
+]
 
-    def test_maximum_has_cloudflare(self):
-        """Test that only maximum profile solves Cloudflare."""
-        minimal = get_minimal_stealth()
-        standard = get_standard_stealth()
-        maximum = get_maximum_stealth()
 
-        assert minimal.solve_cloudflare is False
-        assert standard.solve_cloudflare is False
-        assert maximum.solve_cloudflare is True
+class TestStealthProfilesComparison:
+    """Tests comparing different stealth profiles."""
 
-    def test_profiles_are_independent(self):
+    @pytest.mark.parametrize("profile_name,attr,expected", PROFILE_EXPECTATIONS)
+    def test_profile_attr(
+        self, profile_name, attr, expected, minimal_config, standard_config, maximum_config
+    ):
+        """Test cross-profile attribute expectations."""
+        profiles = {
+            "minimal": minimal_config,
+            "standard": standard_config,
+            "maximum": maximum_config,
+        }
+        assert getattr(profiles[profile_name], attr) == expected
+
+    def test_profile_timeouts_increase(self, minimal_config, standard_config, maximum_config):
+        """Test that timeouts grow with the stealth level."""
+        assert minimal_config.timeout < standard_config.timeout < maximum_config.timeout
+
+    def test_profiles_are_independent(self, fresh_minimal):
         """Test that each preset function returns independent config objects."""
-        minimal = get_minimal_stealth()
         standard = get_standard_stealth()
         maximum = get_maximum_stealth()
 
-        # Modify minimal
-        minimal.timeout = 999
+        # Modify a fresh minimal config (never the shared session fixture)
+        fresh_minimal.timeout = 999
 
         # Others should be unchanged
         assert standard.timeout == 30
         assert maximum.timeout == 60
-
-    def test_minimal_vs_standard_humanize_difference(self):
-        """Test that minimal and standard have different humanize settings."""
-        minimal = get_minimal_stealth()
-        standard = get_standard_stealth()
-
-        assert minimal.humanize is False
-        assert standard.humanize is True
-
-    def test_maximum_has_geoip(self):
-        """Test that only maximum profile enables geoip."""
-        minimal = get_minimal_stealth()
-        standard = get_standard_stealth()
-        maximum = get_maximum_stealth()
-
-        assert minimal.geoip is False
-        assert standard.geoip is False
-        assert maximum.geoip is True
-
-    def test_minimal_has_more_blocking(self):
-        """Test that minimal profile has more resource blocking enabled."""
-        minimal = get_minimal_stealth()
-        standard = get_standard_stealth()
-
-        # Minimal blocks more resources
-        assert minimal.block_images is True
-        assert standard.block_images is False
-        assert minimal.disable_resources is True
-        assert standard.disable_resources is False